@@ -1,9 +1,12 @@
 import streamlit as st
 import re
+import uuid
 
 from utils.file_utils import extract_text_from_file
-from utils.llm_utils import parse_resume_llm, tailor_resume, chat_edit_resume ,generate_cover_letter
+from utils.llm_utils import parse_resume_llm, tailor_resume, chat_edit_resume ,generate_cover_letter, scheduler
+from llm.scheduler import set_request_context
 from utils.ats_utils import score_resume, extract_keywords_from_job
+from utils.keyword_index import KeywordIndex
 from utils.export_utils import export_pdf, export_docx
  
 
@@ -25,6 +28,15 @@ def clean_llm_resume(text: str) -> str:
         cleaned_lines.append(line)
     return "\n".join(cleaned_lines)
 
+# =========================
+# Keyword index (shared across sessions)
+# =========================
+@st.cache_resource
+def get_keyword_index() -> KeywordIndex:
+    return KeywordIndex()
+
+keyword_index = get_keyword_index()
+
 # =========================
 # UI Styling
 # =========================
@@ -94,6 +106,14 @@ st.markdown("""
 st.set_page_config(page_title="AI Resume Assistant", layout="wide")
 st.title("📄 AI Resume/CV Assistant (LLM + ATS + Chat Editing)")
 
+# Tag this session's LLM calls for fair scheduling between users
+if "session_id" not in st.session_state:
+    st.session_state["session_id"] = uuid.uuid4().hex
+set_request_context(st.session_state["session_id"])
+
+with st.sidebar.expander("LLM queue"):
+    st.json(scheduler.metrics())
+
 # =========================
 # File Upload
 # =========================
@@ -110,6 +130,7 @@ if uploaded_file:
 
     if st.button("Tailor Resume"):
         if job_desc.strip():
+            keyword_index.add_job(job_desc)
             raw_resume = tailor_resume(parse_resume_llm(resume_text), job_desc)
             tailored_resume = clean_llm_resume(raw_resume)
 
@@ -117,11 +138,11 @@ if uploaded_file:
             st.session_state["last_instruction"] = ""
 
             # ATS Score
-            score = score_resume(tailored_resume, job_desc)
+            score = score_resume(tailored_resume, job_desc, index=keyword_index)
             st.metric("ATS Score", f"{score}/100")
 
             # Suggested keywords
-            keywords = extract_keywords_from_job(job_desc)
+            keywords = extract_keywords_from_job(job_desc, index=keyword_index)
             if keywords:
                 st.markdown("**💡 Suggested Keywords for ATS:** " + ", ".join(keywords))
         else:
@@ -175,7 +196,7 @@ if "editable_resume" in st.session_state:
 
     # Update ATS Score
     if uploaded_file and job_desc.strip():
-        score = score_resume(editable_resume, job_desc)
+        score = score_resume(editable_resume, job_desc, index=keyword_index)
         st.metric("ATS Score", f"{score}/100")
 
 
@@ -193,7 +214,7 @@ if "editable_resume" in st.session_state:
 
             # Update ATS score after edit
             if job_desc.strip():
-                score = score_resume(edited_resume, job_desc)
+                score = score_resume(edited_resume, job_desc, index=keyword_index)
                 st.metric("ATS Score", f"{score}/100")
 
     # =========================
@@ -208,7 +229,7 @@ if "editable_resume" in st.session_state:
                 tailored_resume = clean_llm_resume(raw_resume)
                 st.session_state["editable_resume"] = tailored_resume
                 st.success("✅ Resume regenerated.")
-                score = score_resume(tailored_resume, job_desc)
+                score = score_resume(tailored_resume, job_desc, index=keyword_index)
                 st.metric("ATS Score", f"{score}/100")
 
     with col3:
@@ -0,0 +1,144 @@
+# benchmarks/bench_llm_engines.py
+"""
+Run the app's LLM pipeline (parse -> tailor -> chat edit -> cover letter)
+over the same corpus with each backend/model and report latency and
+success rate per stage side by side.
+
+Run from the repository root, e.g.:
+    python -m benchmarks.bench_llm_engines --backends ollama,langchain,stub --models gemma3:1b,gemma3:4b
+    python -m benchmarks.bench_llm_engines --resumes "cvs/*.pdf" --job job.txt
+"""
+import argparse
+import glob
+import statistics
+import time
+from collections import defaultdict
+
+from llm.engine import get_engine, STAGES, STAGE_PARSE
+from utils import llm_utils
+
+SAMPLE_JOB = """Backend Engineer
+Python, Django, PostgreSQL
+Experience with Docker and Kubernetes
+Competitive salary
+"""
+
+SAMPLE_RESUMES = [
+    """Jane Doe
+jane@example.com
+Experience
+Software Engineer at Acme, 2019-2024: built Django REST APIs on PostgreSQL.
+Skills
+Python, SQL, Docker""",
+    """John Smith
++44 20 7946 0000
+Education
+BSc Computer Science, 2021
+Projects
+Kubernetes operator for batch jobs written in Go.""",
+]
+
+EDIT_INSTRUCTION = "Highlight leadership skills"
+
+
+class TimedEngine:
+    """
+    Wraps an engine and records (stage, seconds) for every call.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.timings = defaultdict(list)
+
+    def generate(self, prompt, stage, temperature=0.3):
+        start = time.perf_counter()
+        try:
+            return self.engine.generate(prompt, stage, temperature)
+        finally:
+            self.timings[stage].append(time.perf_counter() - start)
+
+
+def load_corpus(resumes_glob: str = None, job_path: str = None):
+    if job_path:
+        with open(job_path, encoding="utf-8") as f:
+            job = f.read()
+    else:
+        job = SAMPLE_JOB
+
+    if not resumes_glob:
+        return SAMPLE_RESUMES, job
+
+    from utils.file_utils import extract_text_from_pdf, extract_text_from_docx_stream
+    resumes = []
+    for path in sorted(glob.glob(resumes_glob)):
+        with open(path, "rb") as f:
+            data = f.read()
+        if path.lower().endswith(".pdf"):
+            resumes.append(extract_text_from_pdf(data))
+        elif path.lower().endswith(".docx"):
+            resumes.append(extract_text_from_docx_stream(data))
+        else:
+            resumes.append(data.decode("utf-8", errors="ignore"))
+    return resumes, job
+
+
+def run_pipeline(engine, resumes, job):
+    """
+    Run every resume through the pipeline with `engine`.
+    Returns ({stage: [seconds]}, {stage: successes}).
+    """
+    timed = TimedEngine(engine)
+    successes = defaultdict(int)
+    original = llm_utils.engine
+    llm_utils.engine = timed
+    try:
+        for resume_text in resumes:
+            parsed = llm_utils.parse_resume_llm(resume_text)
+            # parse_resume_llm only adds raw_text when it fell back to defaults
+            successes[STAGE_PARSE] += "raw_text" not in parsed
+
+            outputs = [
+                ("tailor", llm_utils.tailor_resume(parsed, job)),
+                ("edit", llm_utils.chat_edit_resume(resume_text, EDIT_INSTRUCTION)),
+                ("cover_letter", llm_utils.generate_cover_letter(resume_text, job)),
+            ]
+            for stage, text in outputs:
+                successes[stage] += bool(text.strip()) and not text.startswith("Error:")
+    finally:
+        llm_utils.engine = original
+    return timed.timings, successes
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", default="ollama,langchain,stub")
+    parser.add_argument("--models", default="gemma3:1b,gemma3:4b")
+    parser.add_argument("--resumes", help="glob of resume files (.pdf, .docx or text); defaults to built-in samples")
+    parser.add_argument("--job", help="job description text file; defaults to a built-in sample")
+    args = parser.parse_args()
+
+    resumes, job = load_corpus(args.resumes, args.job)
+    print(f"{len(resumes)} resumes, stages: {', '.join(STAGES)}\n")
+    print(f"{'backend':<10}{'model':<14}{'stage':<14}{'ok':>7}{'median s':>10}{'p95 s':>9}")
+
+    for backend in args.backends.split(","):
+        for model in args.models.split(","):
+            # Same model for every stage, ignoring RESUME_LLM_MODEL_<STAGE> overrides
+            engine = get_engine(backend, model=model, stage_models={})
+            timings, successes = run_pipeline(engine, resumes, job)
+            for stage in STAGES:
+                seconds = timings.get(stage)
+                if not seconds:
+                    continue
+                ok = f"{successes[stage]}/{len(resumes)}"
+                print(f"{backend:<10}{model:<14}{stage:<14}{ok:>7}"
+                      f"{statistics.median(seconds):>10.3f}{percentile(seconds, 95):>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# benchmarks/check_keyword_ranking.py
+"""
+Check that IDF keyword ranking puts real skills above corpus-wide boilerplate.
+
+Indexes a corpus of JDs that share recruiting boilerplate, then extracts
+keywords from a JD naming a few skills. Exits non-zero on failure.
+
+Run from the repository root:
+    python -m benchmarks.check_keyword_ranking
+"""
+import os
+import sys
+import tempfile
+
+from utils.ats_utils import extract_keywords_from_job, score_resume
+from utils.keyword_index import KeywordIndex
+
+BOILERPLATE = """We offer competitive salary and flexible hours.
+Join our growing team.
+We are an equal opportunity employer.
+"""
+
+CORPUS_SKILLS = ["java", "react", "sql", "excel", "figma", "rust", "php", "sales", "tableau", "scala"]
+# Multi-word skills that only ever appear as a phrase
+CORPUS_PHRASES = ["machine learning", "computer vision", "project management"]
+
+BASE_JD = """Backend Engineer. Join our team to build scalable services in Python and Go.
+Experience with Kubernetes and AWS required.
+Machine learning, computer vision.
+""" + BOILERPLATE
+
+SKILLS = ["python", "go", "kubernetes", "aws", "machine learning", "computer vision"]
+BOILERPLATE_WORDS = ["competitive", "salary", "flexible", "hours", "equal", "opportunity", "employer"]
+
+
+def build_index(path, n_jobs):
+    index = KeywordIndex(path)
+    for i in range(n_jobs):
+        skill = CORPUS_SKILLS[i % len(CORPUS_SKILLS)]
+        phrase = CORPUS_PHRASES[i % len(CORPUS_PHRASES)]
+        index.add_job(f"Role {i}: engineer with {skill} experience, {i} years.\n{phrase}\n" + BOILERPLATE)
+    index.add_job(BASE_JD)
+    return index
+
+
+def main():
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        index = build_index(os.path.join(tmp, "index.sqlite3"), 50)
+        keywords = extract_keywords_from_job(BASE_JD, index=index)
+        print("keywords:", keywords)
+
+        for skill in SKILLS:
+            if skill not in keywords:
+                failures.append(f"skill {skill!r} missing from keywords")
+        for kw in keywords:
+            if any(w in kw.split() for w in BOILERPLATE_WORDS):
+                failures.append(f"boilerplate {kw!r} suggested as a keyword")
+
+        skills_score = score_resume(
+            "Backend engineer. Python, Go, Kubernetes, AWS, machine learning, computer vision", BASE_JD, index=index
+        )
+        boilerplate_score = score_resume(BOILERPLATE, BASE_JD, index=index)
+        print("score with skills:", skills_score, "with boilerplate only:", boilerplate_score)
+        if skills_score <= boilerplate_score or boilerplate_score:
+            failures.append("boilerplate still counts towards the ATS score")
+
+        # A fresh install has too few JDs for IDF and must rank like the plain frequency path
+        fresh = build_index(os.path.join(tmp, "fresh.sqlite3"), 0)
+        if extract_keywords_from_job(BASE_JD, index=fresh) != extract_keywords_from_job(BASE_JD):
+            failures.append("near-empty index changed the keyword ranking")
+
+    for failure in failures:
+        print("FAIL:", failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
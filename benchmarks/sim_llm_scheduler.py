@@ -0,0 +1,138 @@
+# benchmarks/sim_llm_scheduler.py
+"""
+Simulate several users hitting one model server and compare first-come-
+first-served with the priority/fair LLMScheduler.
+
+A stub Ollama server (/api/generate) handles one request at a time and
+sleeps a per-stage service time; users issue a random mix of chat edits,
+tailoring and cover letters through OllamaHTTPEngine.
+
+Run from the repository root:
+    python -m benchmarks.sim_llm_scheduler --users 8 --requests 15
+"""
+import argparse
+import json
+import random
+import statistics
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from llm.engine import OllamaHTTPEngine, STAGE_EDIT, STAGE_TAILOR, STAGE_COVER_LETTER
+from llm.scheduler import (
+    LLMScheduler, ScheduledEngine, SchedulerRejected, set_request_context,
+    ANONYMOUS_SESSION, PRIORITY_BATCH, PRIORITY_COVER_LETTER,
+)
+
+# Seconds the stub model spends per stage, and how often users trigger it
+SERVICE_TIMES = {STAGE_EDIT: 0.05, STAGE_TAILOR: 0.3, STAGE_COVER_LETTER: 0.4}
+STAGE_MIX = {STAGE_EDIT: 0.6, STAGE_TAILOR: 0.25, STAGE_COVER_LETTER: 0.15}
+
+
+def start_stub_server():
+    """
+    Start a stub Ollama server on a free port; returns (server, url).
+    The prompt starts with the stage name, which selects the service time.
+    """
+    model_lock = threading.Lock()  # the model serves one request at a time
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            stage = body["prompt"].split(":", 1)[0]
+            with model_lock:
+                time.sleep(SERVICE_TIMES.get(stage, 0.1))
+            payload = json.dumps({"response": f"stub reply to {body['prompt']}"}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def run_load(engine, users: int, requests_per_user: int, think_time: float, fifo: bool, seed: int):
+    """
+    Run all simulated users to completion.
+    Returns ({stage: [latency seconds]}, {stage: rejected count}).
+    """
+    latencies = defaultdict(list)
+    rejected = defaultdict(int)
+    lock = threading.Lock()
+    stages, weights = zip(*STAGE_MIX.items())
+
+    def user(index):
+        rng = random.Random(seed + index)
+        if fifo:
+            # One shared session and class turns the scheduler into a plain FIFO queue
+            set_request_context(ANONYMOUS_SESSION, PRIORITY_BATCH)
+        else:
+            set_request_context(f"user-{index}")
+        for i in range(requests_per_user):
+            time.sleep(rng.expovariate(1 / think_time))
+            stage = rng.choices(stages, weights)[0]
+            start = time.perf_counter()
+            try:
+                engine.generate(f"{stage}:user-{index}:{i}", stage)
+            except SchedulerRejected:
+                with lock:
+                    rejected[stage] += 1
+                continue
+            with lock:
+                latencies[stage].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=user, args=(i,)) for i in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, rejected
+
+
+def report(label, latencies, rejected):
+    for stage in STAGE_MIX:
+        values = sorted(latencies.get(stage, []))
+        if not values:
+            continue
+        p95 = values[int(0.95 * (len(values) - 1))]
+        print(f"{label:<11}{stage:<14}{len(values):>6}{rejected.get(stage, 0):>9}"
+              f"{statistics.median(values):>10.3f}{p95:>9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=15, help="requests per user")
+    parser.add_argument("--think-time", type=float, default=0.5, help="mean seconds between a user's requests")
+    parser.add_argument("--cover-letter-budget", type=float, default=1.0,
+                        help="max estimated wait (s) before cover letters are deferred to batch")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server, url = start_stub_server()
+    print(f"{'mode':<11}{'stage':<14}{'done':>6}{'rejected':>9}{'median s':>10}{'p95 s':>9}")
+    try:
+        for label, fifo in (("fifo", True), ("scheduler", False)):
+            budgets = {} if fifo else {PRIORITY_COVER_LETTER: args.cover_letter_budget}
+            scheduler = LLMScheduler(workers=1, wait_budgets=budgets,
+                                     initial_service_time=statistics.mean(SERVICE_TIMES.values()))
+            engine = ScheduledEngine(OllamaHTTPEngine(host=url), scheduler)
+            latencies, rejected = run_load(engine, args.users, args.requests, args.think_time, fifo, args.seed)
+            scheduler.shutdown()
+            report(label, latencies, rejected)
+            if not fifo:
+                print("\nscheduler metrics:")
+                print(json.dumps(scheduler.metrics(), indent=2))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# llm/engine.py
+import hashlib
+import json
+import os
+import re
+import time
+
+# Pipeline stages, so each one can be pointed at its own model
+STAGE_PARSE = "parse"
+STAGE_TAILOR = "tailor"
+STAGE_EDIT = "edit"
+STAGE_COVER_LETTER = "cover_letter"
+STAGES = [STAGE_PARSE, STAGE_TAILOR, STAGE_EDIT, STAGE_COVER_LETTER]
+
+DEFAULT_BACKEND = os.environ.get("RESUME_LLM_BACKEND", "langchain")
+DEFAULT_MODEL = os.environ.get("RESUME_LLM_MODEL", "gemma3:4b")
+OLLAMA_HOST = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+
+
+class LLMEngine:
+    """
+    Common interface of every backend: prompt in, plain text out.
+    Backends raise on failure; callers decide on the fallback.
+    """
+    name = "base"
+
+    def __init__(self, model: str = DEFAULT_MODEL, stage_models: dict = None):
+        self.model = model
+        self.stage_models = stage_models or {}
+
+    def model_for(self, stage: str) -> str:
+        return self.stage_models.get(stage, self.model)
+
+    def generate(self, prompt: str, stage: str, temperature: float = 0.3) -> str:
+        return self._generate(prompt, self.model_for(stage), temperature)
+
+    def _generate(self, prompt: str, model: str, temperature: float) -> str:
+        raise NotImplementedError
+
+
+class OllamaHTTPEngine(LLMEngine):
+    """
+    Calls Ollama's /api/generate endpoint directly over HTTP.
+    """
+    name = "ollama"
+
+    def __init__(self, model: str = DEFAULT_MODEL, stage_models: dict = None,
+                 host: str = OLLAMA_HOST, timeout: float = 300):
+        super().__init__(model, stage_models)
+        import requests
+        self.url = host.rstrip("/") + "/api/generate"
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def _generate(self, prompt, model, temperature):
+        response = self.session.post(
+            self.url,
+            json={
+                "model": model,
+                "prompt": prompt,
+                "stream": False,
+                "options": {"temperature": temperature},
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response.json()["response"]
+
+
+class LangChainEngine(LLMEngine):
+    """
+    Goes through LangChain's Ollama wrapper (one client per model).
+    """
+    name = "langchain"
+
+    def __init__(self, model: str = DEFAULT_MODEL, stage_models: dict = None):
+        super().__init__(model, stage_models)
+        self._clients = {}
+
+    def _generate(self, prompt, model, temperature):
+        if model not in self._clients:
+            from langchain_community.llms import Ollama
+            self._clients[model] = Ollama(model=model)
+        return self._clients[model].invoke(prompt, temperature=temperature)
+
+
+class StubEngine(LLMEngine):
+    """
+    In-process deterministic backend for benchmarks and offline runs.
+    The same prompt and model always yield the same output; prompts asking
+    for JSON get a JSON reply. `latency` (seconds) simulates model time.
+    """
+    name = "stub"
+
+    def __init__(self, model: str = DEFAULT_MODEL, stage_models: dict = None, latency: float = 0.0):
+        super().__init__(model, stage_models)
+        self.latency = latency
+
+    def _generate(self, prompt, model, temperature):
+        if self.latency:
+            time.sleep(self.latency)
+        digest = hashlib.sha1(f"{model}\n{prompt}".encode("utf-8")).hexdigest()[:8]
+        if "Return ONLY valid JSON" in prompt:
+            return json.dumps({
+                "personal_info": {"name": "", "contact": ""},
+                "education": [],
+                "experience": [],
+                "skills": [],
+                "projects": [],
+                "achievements": [],
+                "stub_id": f"{model}-{digest}",
+            })
+        return f"Summary\nStub {model} output {digest}"
+
+
+BACKENDS = {
+    OllamaHTTPEngine.name: OllamaHTTPEngine,
+    LangChainEngine.name: LangChainEngine,
+    StubEngine.name: StubEngine,
+}
+
+
+def stage_models_from_env() -> dict:
+    """
+    Per-stage model overrides from RESUME_LLM_MODEL_<STAGE>, e.g. RESUME_LLM_MODEL_EDIT=gemma3:1b.
+    """
+    models = {}
+    for stage in STAGES:
+        model = os.environ.get(f"RESUME_LLM_MODEL_{stage.upper()}")
+        if model:
+            models[stage] = model
+    return models
+
+
+def get_engine(backend: str = DEFAULT_BACKEND, **kwargs) -> LLMEngine:
+    """
+    Build an engine by backend name ("ollama", "langchain" or "stub").
+    Unless stage_models is given, per-stage models come from the environment.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown LLM backend {backend!r}; choose from {sorted(BACKENDS)}")
+    kwargs.setdefault("stage_models", stage_models_from_env())
+    return BACKENDS[backend](**kwargs)
+
+
+def extract_json(text: str) -> dict:
+    """
+    Parse the JSON object in an LLM reply, tolerating ```json fences around it.
+    Raises json.JSONDecodeError if there is none.
+    """
+    match = re.search(r"```(?:json)?\s*(.*?)```", text, flags=re.DOTALL)
+    if match:
+        text = match.group(1)
+    return json.loads(text.strip())
@@ -0,0 +1,291 @@
+# llm/scheduler.py
+import contextvars
+import statistics
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+
+from llm.engine import STAGE_PARSE, STAGE_TAILOR, STAGE_EDIT, STAGE_COVER_LETTER
+
+# Priority classes, lower value is served first
+PRIORITY_EDIT = 0
+PRIORITY_TAILOR = 1
+PRIORITY_COVER_LETTER = 2
+PRIORITY_BATCH = 3
+PRIORITY_NAMES = {
+    PRIORITY_EDIT: "interactive_edit",
+    PRIORITY_TAILOR: "tailoring",
+    PRIORITY_COVER_LETTER: "cover_letter",
+    PRIORITY_BATCH: "batch",
+}
+
+STAGE_PRIORITY = {
+    STAGE_EDIT: PRIORITY_EDIT,
+    STAGE_PARSE: PRIORITY_TAILOR,
+    STAGE_TAILOR: PRIORITY_TAILOR,
+    STAGE_COVER_LETTER: PRIORITY_COVER_LETTER,
+}
+
+# Admission control: max estimated wait (seconds) per class and what to do beyond it.
+# Classes without a budget are always admitted. A deferred request moves to the
+# batch queue and is never rejected afterwards.
+DEFAULT_WAIT_BUDGETS = {PRIORITY_COVER_LETTER: 60.0, PRIORITY_BATCH: 300.0}
+DEFAULT_OVERLOAD_POLICY = {PRIORITY_COVER_LETTER: "defer", PRIORITY_BATCH: "reject"}
+
+# A job queued this long (seconds) is served before newer work of any class
+DEFAULT_AGING_AFTER = 120.0
+# How long (seconds) ScheduledEngine callers wait before giving up and cancelling
+DEFAULT_REQUEST_TIMEOUT = 600.0
+
+# Requests made without a session id all share this one
+ANONYMOUS_SESSION = "anonymous"
+
+_request_context = contextvars.ContextVar("llm_request_context", default=(ANONYMOUS_SESSION, None))
+
+
+def set_request_context(session_id: str, priority: int = None):
+    """
+    Tag LLM calls made from the current thread/context with a session id
+    and, optionally, a fixed priority class (e.g. PRIORITY_BATCH).
+    """
+    _request_context.set((session_id, priority))
+
+
+class SchedulerRejected(Exception):
+    """Raised when admission control turns a request away."""
+
+
+class LLMScheduler:
+    """
+    Runs LLM calls on a fixed number of workers (concurrent calls to the
+    model server). The highest priority class with queued work is served
+    first; inside a class, sessions take turns so one user's burst cannot
+    starve the others. Jobs older than `aging_after` seconds jump ahead so
+    low classes still make progress under constant load. Service times are
+    tracked per class (EWMA) to estimate the wait of new requests for
+    admission control.
+    """
+
+    def __init__(self, workers: int = 1, wait_budgets: dict = None, overload_policy: dict = None,
+                 aging_after: float = DEFAULT_AGING_AFTER, initial_service_time: float = 5.0,
+                 ewma_alpha: float = 0.2, history: int = 1000):
+        self.workers = workers
+        self.wait_budgets = DEFAULT_WAIT_BUDGETS if wait_budgets is None else wait_budgets
+        self.overload_policy = DEFAULT_OVERLOAD_POLICY if overload_policy is None else overload_policy
+        self.aging_after = aging_after
+        self.ewma_alpha = ewma_alpha
+
+        self._cond = threading.Condition()
+        # queue priority -> OrderedDict(session_id -> deque of jobs); dict order is the round-robin order
+        self._queues = {p: OrderedDict() for p in PRIORITY_NAMES}
+        self._depth = dict.fromkeys(PRIORITY_NAMES, 0)
+        self._queued_work = dict.fromkeys(PRIORITY_NAMES, 0.0)  # estimated seconds queued per queue
+        self._service_time = dict.fromkeys(PRIORITY_NAMES, initial_service_time)
+        self._in_flight = {}  # worker index -> (class, start time)
+        self._waits = {p: deque(maxlen=history) for p in PRIORITY_NAMES}
+        self._counts = {name: dict.fromkeys(PRIORITY_NAMES, 0)
+                        for name in ("submitted", "completed", "failed", "cancelled", "deferred", "rejected")}
+        self._closed = False
+
+        self._threads = [
+            threading.Thread(target=self._worker, args=(i,), name=f"llm-scheduler-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, session_id: str = ANONYMOUS_SESSION, priority: int = PRIORITY_BATCH) -> Future:
+        """
+        Queue fn() and return a Future for its result.
+        If the estimated wait is over the class budget, a "defer" class is moved
+        to the batch queue (never rejected afterwards) and a "reject" class raises
+        SchedulerRejected. Counters and wait times stay under the submitted class.
+        """
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("LLM scheduler is shut down")
+            self._counts["submitted"][priority] += 1
+
+            queue = priority
+            budget = self.wait_budgets.get(priority)
+            estimate = self._estimated_wait(priority)
+            if budget is not None and estimate > budget:
+                if self.overload_policy.get(priority, "reject") == "defer" and priority != PRIORITY_BATCH:
+                    self._counts["deferred"][priority] += 1
+                    queue = PRIORITY_BATCH
+                else:
+                    self._counts["rejected"][priority] += 1
+                    raise SchedulerRejected(
+                        f"{PRIORITY_NAMES[priority]} request rejected: estimated wait "
+                        f"{estimate:.1f}s exceeds budget {budget:.1f}s"
+                    )
+
+            cost = self._service_time[priority]
+            job = (fn, future, time.monotonic(), priority, cost)
+            sessions = self._queues[queue]
+            sessions.setdefault(session_id, deque()).append(job)
+            self._depth[queue] += 1
+            self._queued_work[queue] += cost
+            self._cond.notify()
+
+        future.add_done_callback(lambda f: f.cancelled() and self._discard(queue, session_id, job))
+        return future
+
+    def _discard(self, queue, session_id, job):
+        # A cancelled job leaves the queue right away so it no longer inflates wait estimates
+        with self._cond:
+            jobs = self._queues[queue].get(session_id)
+            if not jobs or job not in jobs:
+                return  # already taken by a worker, which counts it as cancelled
+            jobs.remove(job)
+            if not jobs:
+                del self._queues[queue][session_id]
+            self._depth[queue] -= 1
+            self._queued_work[queue] = max(0.0, self._queued_work[queue] - job[4])
+            self._counts["cancelled"][job[3]] += 1
+
+    def estimated_wait(self, priority: int) -> float:
+        """
+        Estimated seconds before a request of this class would start.
+        """
+        with self._cond:
+            return self._estimated_wait(priority)
+
+    def _estimated_wait(self, priority):
+        # Work queued at the same or higher priority, plus what is left of running calls
+        now = time.monotonic()
+        queued = sum(self._queued_work[p] for p in PRIORITY_NAMES if p <= priority)
+        running = sum(max(0.0, self._service_time[p] - (now - start)) for p, start in self._in_flight.values())
+        if len(self._in_flight) < self.workers and not any(self._depth[p] for p in PRIORITY_NAMES if p <= priority):
+            return 0.0
+        return (queued + running) / self.workers
+
+    def _next_job(self):
+        # Aged jobs first (oldest wins), then highest priority with round-robin between sessions
+        if self.aging_after is not None:
+            deadline = time.monotonic() - self.aging_after
+            oldest = None
+            for queue, sessions in self._queues.items():
+                for session_id, jobs in sessions.items():
+                    enqueued_at = jobs[0][2]
+                    if enqueued_at <= deadline and (oldest is None or enqueued_at < oldest[2]):
+                        oldest = (queue, session_id, enqueued_at)
+            if oldest:
+                return self._pop(oldest[0], oldest[1])
+
+        for queue in sorted(self._queues):
+            sessions = self._queues[queue]
+            if sessions:
+                return self._pop(queue, next(iter(sessions)))
+        return None
+
+    def _pop(self, queue, session_id):
+        sessions = self._queues[queue]
+        jobs = sessions[session_id]
+        job = jobs.popleft()
+        if jobs:
+            sessions.move_to_end(session_id)
+        else:
+            del sessions[session_id]
+        self._depth[queue] -= 1
+        self._queued_work[queue] = max(0.0, self._queued_work[queue] - job[4])
+        return job
+
+    def _worker(self, index):
+        while True:
+            with self._cond:
+                while True:
+                    job = self._next_job()
+                    if job or self._closed:
+                        break
+                    self._cond.wait()
+                if job is None:
+                    return
+                fn, future, enqueued_at, priority, _ = job
+                # Callers that gave up cancel their future; skip it without using model time
+                if not future.set_running_or_notify_cancel():
+                    self._counts["cancelled"][priority] += 1
+                    continue
+                started = time.monotonic()
+                self._waits[priority].append(started - enqueued_at)
+                self._in_flight[index] = (priority, started)
+
+            outcome = "completed"
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                outcome = "failed"
+                future.set_exception(e)
+
+            with self._cond:
+                del self._in_flight[index]
+                elapsed = time.monotonic() - started
+                self._service_time[priority] += self.ewma_alpha * (elapsed - self._service_time[priority])
+                self._counts[outcome][priority] += 1
+
+    def metrics(self) -> dict:
+        """
+        Snapshot per priority class: queue depth (by queue, so deferred cover
+        letters count under batch), in-flight calls, wait-time percentiles
+        (seconds, over recent requests), estimated service time and counters
+        (by the class each request was submitted as).
+        """
+        with self._cond:
+            classes = {}
+            for priority, name in PRIORITY_NAMES.items():
+                waits = sorted(self._waits[priority])
+                classes[name] = {
+                    "queue_depth": self._depth[priority],
+                    "in_flight": sum(1 for p, _ in self._in_flight.values() if p == priority),
+                    "wait_p50": statistics.median(waits) if waits else 0.0,
+                    "wait_p95": waits[int(0.95 * (len(waits) - 1))] if waits else 0.0,
+                    "wait_max": waits[-1] if waits else 0.0,
+                    "service_time": self._service_time[priority],
+                    "estimated_wait": self._estimated_wait(priority),
+                    **{counter: counts[priority] for counter, counts in self._counts.items()},
+                }
+            return classes
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the workers once the queues are drained.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+class ScheduledEngine:
+    """
+    Engine wrapper that sends every generate() call through an LLMScheduler.
+    The session comes from set_request_context(); the priority class from the
+    context override or else from the pipeline stage. Callers wait at most
+    `timeout` seconds, then a still-queued job is cancelled. A Streamlit
+    stop or rerun does not interrupt the wait, so the timeout is what bounds
+    abandoned requests.
+    """
+
+    def __init__(self, engine, scheduler: LLMScheduler, timeout: float = DEFAULT_REQUEST_TIMEOUT):
+        self.engine = engine
+        self.scheduler = scheduler
+        self.timeout = timeout
+
+    def generate(self, prompt: str, stage: str, temperature: float = 0.3) -> str:
+        session_id, priority = _request_context.get()
+        if priority is None:
+            priority = STAGE_PRIORITY.get(stage, PRIORITY_BATCH)
+        future = self.scheduler.submit(
+            lambda: self.engine.generate(prompt, stage, temperature),
+            session_id=session_id,
+            priority=priority,
+        )
+        try:
+            return future.result(timeout=self.timeout)
+        except BaseException:
+            future.cancel()
+            raise
@@ -2,34 +2,55 @@ import re
 from collections import Counter
 from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
 
-def score_resume(resume_text: str, job_desc: str) -> int:
+# sklearn's stop word list includes a few skill names
+STOP_WORDS = ENGLISH_STOP_WORDS - {"go"}
+
+MAX_NGRAM = 3
+# Below this many indexed JDs, IDF is too noisy and ranking falls back to plain frequency
+MIN_INDEX_DOCS = 5
+# A multi-word phrase is a keyword candidate if it was seen in another JD and
+# its rarest word occurs inside the phrase at least this often
+COLLOCATION_RATIO = 0.5
+
+def score_resume(resume_text: str, job_desc: str, index=None) -> int:
     """
     ATS scoring based on keyword overlap with job description.
+    With a KeywordIndex, each keyword counts by its IDF so boilerplate
+    phrases shared by most JDs barely move the score.
     """
     resume_text = resume_text.lower()
     job_desc = job_desc.lower()
 
     # Extract keywords dynamically
-    jd_keywords = extract_keywords_from_job(job_desc, top_n=50)
+    jd_keywords = _rank_keywords(job_desc, top_n=50, index=index)
     resume_words = set(re.findall(r"\w+", resume_text.lower()))
 
-    # Count how many job keywords are present in the resume
-    matched_keywords = [kw for kw in jd_keywords if all(w in resume_words for w in kw.split())]
-    if not jd_keywords:
+    # Weight the job keywords that are present in the resume
+    total = sum(weight for _, weight in jd_keywords)
+    if not total:
         return 0
-    score = int(len(matched_keywords) / len(jd_keywords) * 100)
+    matched = sum(weight for kw, weight in jd_keywords if all(w in resume_words for w in kw.split()))
+    score = int(matched / total * 100)
     return min(score, 100)
 
 
-def extract_keywords_from_job(job_desc: str, top_n: int = 15):
+def extract_keywords_from_job(job_desc: str, top_n: int = 15, index=None):
     """
     Dynamically extract keywords (tools, languages, skills, requirements) from job description.
-    Returns top_n keywords sorted by frequency.
+    Returns top_n keywords sorted by frequency, or by frequency * IDF when a KeywordIndex is given.
+    """
+    return [kw for kw, _ in _rank_keywords(job_desc, top_n, index)]
+
+
+def _clean_phrases(job_desc: str, separators: str = r'[,:;\n]'):
+    """
+    Split a job description into phrases and drop generic stopwords.
+    Returns one list of words per phrase.
     """
     job_desc = job_desc.lower()
 
     # Capture multi-word phrases by splitting on punctuation and conjunctions
-    phrases = re.split(r'[,:;\n]', job_desc)
+    phrases = re.split(separators, job_desc)
 
     # Clean phrases
     cleaned_phrases = []
@@ -38,11 +59,60 @@ def extract_keywords_from_job(job_desc: str, top_n: int = 15):
         if not p:
             continue
         # Ignore generic stopwords
-        words = [w for w in re.findall(r'\w+', p) if w not in ENGLISH_STOP_WORDS]
+        words = [w for w in re.findall(r'\w+', p) if w not in STOP_WORDS]
         if words:
-            cleaned_phrases.append(" ".join(words))
+            cleaned_phrases.append(words)
+    return cleaned_phrases
+
+
+def job_ngrams(job_desc: str, max_n: int = MAX_NGRAM):
+    """
+    Each cleaned phrase of a job description plus all its 1..max_n word n-grams.
+    N-grams never cross phrase or sentence boundaries.
+    """
+    ngrams = []
+    for words in _clean_phrases(job_desc, separators=r'[,:;\n]|[.!?](?:\s|$)'):
+        for n in range(1, min(max_n, len(words)) + 1):
+            for i in range(len(words) - n + 1):
+                ngrams.append(" ".join(words[i:i + n]))
+        if len(words) > max_n:
+            ngrams.append(" ".join(words))
+    return ngrams
+
+
+def _rank_keywords(job_desc: str, top_n: int, index=None):
+    """
+    Return [(keyword, weight)] for the top_n keywords of a job description.
+    Without an index (or with fewer than MIN_INDEX_DOCS JDs in it), keywords are
+    whole phrases ranked by frequency (weight 1).
+    With an index, candidates are single words plus phrases whose words occur
+    together across JDs (see COLLOCATION_RATIO), ranked by tf * idf (weight idf),
+    longer first on ties. Phrases found in every JD get idf 0 and are dropped, and
+    a candidate covered by an already picked phrase is skipped.
+    """
+    if index is None or index.num_documents() < MIN_INDEX_DOCS:
+        freq = Counter(" ".join(words) for words in _clean_phrases(job_desc))
+        return [(kw, 1.0) for kw, _ in freq.most_common(top_n)]
 
-    # Count frequency
-    freq = Counter(cleaned_phrases)
-    top_keywords = [kw for kw, _ in freq.most_common(top_n)]
-    return top_keywords
+    tf = Counter(job_ngrams(job_desc))
+    df = index.document_frequencies(tf)
+    idf = index.idf(tf)
+
+    def is_candidate(kw):
+        words = kw.split()
+        if len(words) == 1:
+            return True
+        return df[kw] >= 2 and df[kw] >= COLLOCATION_RATIO * min(df[w] for w in words)
+
+    score = {kw: tf[kw] * idf[kw] for kw in tf if idf[kw] > 0 and is_candidate(kw)}
+    ranked = sorted(score, key=lambda kw: (-score[kw], -len(kw.split()), kw))
+
+    picked = []
+    for kw in ranked:
+        if len(picked) >= top_n:
+            break
+        padded = f" {kw} "
+        if any(padded in f" {p} " for p, _ in picked):
+            continue
+        picked.append((kw, idf[kw]))
+    return picked
@@ -1,8 +1,13 @@
 # utils/file_utils.py
 import io
+import zipfile
+import xml.etree.ElementTree as ET
 from PyPDF2 import PdfReader
 from docx import Document
 
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_NS = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
 def extract_text_from_pdf(pdf_bytes):
     try:
         reader = PdfReader(io.BytesIO(pdf_bytes))
@@ -27,10 +32,92 @@ def extract_text_from_docx(docx_bytes):
     except Exception as e:
         return f"DOCX extraction failed: {str(e)}"
 
+def iter_docx_text(docx_bytes):
+    """
+    Stream the text blocks of a DOCX in document order without building python-docx's object model.
+    Yields one string per body paragraph, per table cell and per text-box paragraph;
+    text-box paragraphs follow the paragraph they are anchored in, and nested tables
+    are folded into the cell that contains them.
+    Elements are cleared as soon as they are read, so memory stays bounded on large files.
+    """
+    with zipfile.ZipFile(io.BytesIO(docx_bytes)) as zf, zf.open("word/document.xml") as xml:
+        # Open paragraphs (text runs, nested text-box paragraphs) and table cells (paragraph texts),
+        # innermost last; finished blocks go to the enclosing container or are yielded at body level
+        containers = []
+        body = None
+        depth = 0
+        fallback_depth = 0  # inside mc:Fallback, which duplicates the text box content of mc:Choice
+        ppr_depth = 0  # inside w:pPr, whose w:tab elements are tab stops, not text
+
+        for event, elem in ET.iterparse(xml, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                depth += 1
+                if tag == MC_NS + "Fallback":
+                    fallback_depth += 1
+                elif fallback_depth:
+                    continue
+                elif tag == W_NS + "pPr":
+                    ppr_depth += 1
+                elif tag == W_NS + "p":
+                    containers.append(("p", [], []))
+                elif tag == W_NS + "tc":
+                    containers.append(("tc", []))
+                elif tag == W_NS + "body":
+                    body = elem
+                continue
+
+            texts = None
+            if tag == MC_NS + "Fallback":
+                fallback_depth -= 1
+            elif fallback_depth:
+                pass
+            elif tag == W_NS + "pPr":
+                ppr_depth -= 1
+            elif ppr_depth:
+                pass
+            elif tag == W_NS + "t" and containers:
+                containers[-1][1].append(elem.text or "")
+            elif tag == W_NS + "tab" and containers:
+                containers[-1][1].append("\t")
+            elif tag in (W_NS + "br", W_NS + "cr") and containers:
+                containers[-1][1].append("\n")
+            elif tag == W_NS + "p":
+                _, runs, nested = containers.pop()
+                texts = ["".join(runs)] + nested
+            elif tag == W_NS + "tc":
+                _, paragraphs = containers.pop()
+                texts = ["\n".join(t for t in paragraphs if t.strip())]
+
+            if texts is not None:
+                if not containers:
+                    for text in texts:
+                        if text.strip():
+                            yield text
+                elif containers[-1][0] == "p":
+                    containers[-1][2].extend(texts)
+                else:
+                    containers[-1][1].extend(texts)
+
+            elem.clear()
+            # Drop finished top-level blocks (body children) from the tree
+            if depth == 3 and body is not None:
+                body.clear()
+            depth -= 1
+
+def extract_text_from_docx_stream(docx_bytes):
+    try:
+        text = "\n".join(iter_docx_text(docx_bytes))
+        if not text.strip():
+            return "DOCX contains no extractable text."
+        return text
+    except Exception as e:
+        return f"DOCX extraction failed: {str(e)}"
+
 def extract_text_from_file(uploaded_file):
     if uploaded_file.type == "application/pdf":
         return extract_text_from_pdf(uploaded_file.read())
     elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        return extract_text_from_docx(uploaded_file.read())
+        return extract_text_from_docx_stream(uploaded_file.read())
     else:
         return "Unsupported file type. Please upload PDF or DOCX."
@@ -0,0 +1,103 @@
+# utils/keyword_index.py
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from utils.ats_utils import job_ngrams
+
+DEFAULT_INDEX_PATH = os.environ.get("RESUME_KEYWORD_INDEX", "keyword_index.sqlite3")
+
+# SQLite caps the number of bound parameters per statement (999 on older builds)
+_LOOKUP_CHUNK = 500
+
+
+class KeywordIndex:
+    """
+    On-disk document-frequency index of every job description seen.
+
+    Each JD contributes its distinct 1..3-word phrases once, so adding a JD
+    costs O(size of that JD) and lookups are primary-key probes that stay
+    fast as the corpus grows. Identical JDs (e.g. Streamlit reruns) are
+    counted only once.
+    """
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS phrase_df (
+                    phrase TEXT PRIMARY KEY,
+                    df INTEGER NOT NULL
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS documents (
+                    digest BLOB PRIMARY KEY
+                ) WITHOUT ROWID;
+            """)
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per operation keeps the index safe to
+        # share between Streamlit sessions running in different threads.
+        with self._lock:
+            conn = sqlite3.connect(self.path)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    def add_job(self, job_desc: str) -> bool:
+        """
+        Add a job description to the index.
+        Returns False if the same JD was already indexed.
+        """
+        phrases = set(job_ngrams(job_desc))
+        digest = hashlib.sha1(" ".join(sorted(phrases)).encode("utf-8")).digest()
+
+        with self._connect() as conn:
+            cur = conn.execute("INSERT OR IGNORE INTO documents (digest) VALUES (?)", (digest,))
+            if cur.rowcount == 0:
+                return False
+            conn.executemany(
+                "INSERT INTO phrase_df (phrase, df) VALUES (?, 1) "
+                "ON CONFLICT(phrase) DO UPDATE SET df = df + 1",
+                ((p,) for p in phrases),
+            )
+        return True
+
+    def num_documents(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def document_frequencies(self, phrases) -> dict:
+        """
+        Return {phrase: df} for the given phrases (0 for unseen phrases).
+        """
+        phrases = list(set(phrases))
+        freqs = dict.fromkeys(phrases, 0)
+        with self._connect() as conn:
+            for start in range(0, len(phrases), _LOOKUP_CHUNK):
+                chunk = phrases[start:start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT phrase, df FROM phrase_df WHERE phrase IN ({placeholders})",
+                    chunk,
+                )
+                freqs.update(rows)
+        return freqs
+
+    def idf(self, phrases) -> dict:
+        """
+        Smoothed inverse document frequency for each phrase:
+        log((1 + N) / (1 + df)), so unseen phrases weigh the most and
+        phrases present in every JD weigh 0.
+        """
+        n_docs = self.num_documents()
+        return {
+            phrase: math.log((1 + n_docs) / (1 + df))
+            for phrase, df in self.document_frequencies(phrases).items()
+        }
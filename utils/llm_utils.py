@@ -1,10 +1,17 @@
 import json
 import logging
-from langchain_community.llms import Ollama
-from langchain_core.prompts import PromptTemplate
-
-# Initialize Ollama model
-llm = Ollama(model="gemma3:4b")
+import os
+from llm.engine import (
+    get_engine, extract_json,
+    STAGE_PARSE, STAGE_TAILOR, STAGE_EDIT, STAGE_COVER_LETTER,
+)
+from llm.scheduler import LLMScheduler, ScheduledEngine
+
+# Shared LLM engine (backend/model configurable via RESUME_LLM_BACKEND / RESUME_LLM_MODEL).
+# Calls from every session go through one scheduler so quick edits are not stuck
+# behind other users' tailoring or cover letters.
+scheduler = LLMScheduler(workers=int(os.environ.get("RESUME_LLM_WORKERS", "1")))
+engine = ScheduledEngine(get_engine(), scheduler)
 
 # Allowed headers in Proper Case
 ALLOWED_HEADERS = [
@@ -32,12 +39,11 @@ Resume text:
 
 Return ONLY valid JSON. If some fields are missing, leave them empty.
 """
-    template = PromptTemplate(template=prompt_text, input_variables=["resume_text"])
-    prompt = template.format(resume_text=resume_text)
+    prompt = prompt_text.format(resume_text=resume_text)
 
     try:
-        response = llm(prompt, temperature=0.1)
-        return json.loads(response)
+        response = engine.generate(prompt, STAGE_PARSE, temperature=0.1)
+        return extract_json(response)
     except json.JSONDecodeError:
         logging.warning(f"Failed to parse JSON. LLM response: {response}")
         return {
@@ -87,11 +93,10 @@ Return a plain text resume that meets the following rules:
 - Do NOT add commentary or explanations.
 - Format clearly and professionally.
 """
-    template = PromptTemplate(template=prompt_text, input_variables=["resume_json", "job_description"])
-    prompt = template.format(resume_json=json.dumps(resume_json), job_description=job_description)
+    prompt = prompt_text.format(resume_json=json.dumps(resume_json), job_description=job_description)
 
     try:
-        response = llm(prompt, temperature=0.5)
+        response = engine.generate(prompt, STAGE_TAILOR, temperature=0.5)
         return response
     except Exception as e:
         logging.error(f"LLM call failed: {e}")
@@ -117,11 +122,10 @@ Return the edited resume in plain text following these rules:
 - Preserve personal_info (name and contact info) at the top.
 - Do not include any commentary or suggestions, only the resume content.
 """
-    template = PromptTemplate(template=prompt_text, input_variables=["resume_text", "instruction"])
-    prompt = template.format(resume_text=resume_text, instruction=instruction)
+    prompt = prompt_text.format(resume_text=resume_text, instruction=instruction)
 
     try:
-        response = llm(prompt, temperature=0.3)
+        response = engine.generate(prompt, STAGE_EDIT, temperature=0.3)
         return response
     except Exception as e:
         logging.error(f"LLM call failed: {e}")
@@ -130,11 +134,8 @@ Return the edited resume in plain text following these rules:
 def generate_cover_letter(resume_text: str, job_description: str) -> str:
     """
     Generate a professional cover letter based on the tailored resume and job description.
-    Uses the same Ollama LLM as the resume functions.
+    Uses the same engine as the resume functions.
     """
-    from langchain_community.llms import Ollama
-    llm = Ollama(model="gemma3:4b")  # same model as in tailor_resume
-
     prompt_text = f"""
 You are an AI assistant that writes professional cover letters.
 Resume content: {resume_text}
@@ -144,9 +145,8 @@ Return a concise, professional cover letter that highlights relevant skills and
 Do NOT include explanations, just the cover letter content.
 """
     try:
-        response = llm(prompt_text, temperature=0.3)
+        response = engine.generate(prompt_text, STAGE_COVER_LETTER, temperature=0.3)
         return response.strip()
     except Exception as e:
-        import logging
         logging.error(f"LLM call failed: {e}")
         return "Error: Could not generate cover letter."